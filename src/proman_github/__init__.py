@@ -14,6 +14,7 @@ from proman_common.filepaths import GlobalDirs
 from proman_common.manifest import LockFile, SourceTreeFile, Manifest
 # from proman_common.system import System
 
+from .async_package_manager import AsyncPackageManager
 from .config import ProjectPaths
 # from .distributions import LocalDistributionPath, UserDistributionPath
 from .package_manager import PackageManager
@@ -27,12 +28,9 @@ __license__ = 'LGPL-3.0'
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 
-def get_package_manager(
-    token: Optional[str] = os.getenv('GITHUB_TOKEN')
-) -> PackageManager:
-    """Get package manager instance."""
+def get_manifest(project_paths: ProjectPaths) -> Optional[Manifest]:
+    """Load project manifest from configuration files."""
     # Load configuration files
-    project_paths = ProjectPaths()
     specfile = None
     lockfile = None
 
@@ -62,16 +60,38 @@ def get_package_manager(
                 'class': 'Dependency',
             }
         )
+    return manifest
+
+
+def get_package_manager(
+    token: Optional[str] = os.getenv('GITHUB_TOKEN')
+) -> PackageManager:
+    """Get package manager instance."""
+    project_paths = ProjectPaths()
 
     # Setup package manager
     return PackageManager(
         github=Github(token),
         dirs=GlobalDirs(),
-        manifest=manifest,
+        paths=project_paths,
+        manifest=get_manifest(project_paths),
+        manifest_loader=get_manifest,
         force=False,
         update=False,
         options={}
     )
 
 
-__all__: List[str] = ['get_package_manager']
+def get_async_package_manager(
+    token: Optional[str] = os.getenv('GITHUB_TOKEN')
+) -> AsyncPackageManager:
+    """Get asyncio package manager instance."""
+    return AsyncPackageManager(get_package_manager(token))
+
+
+__all__: List[str] = [
+    'AsyncPackageManager',
+    'get_async_package_manager',
+    'get_manifest',
+    'get_package_manager',
+]
@@ -2,13 +2,37 @@
 # license: LGPL-3.0, see LICENSE.md for more details.
 """Control Package Archives."""
 
+import bz2
 import gzip
+import json
+import lzma
 import mimetypes
-# import os
+import mmap
+import os
+import shutil
 import tarfile
+from tempfile import mkstemp
+from typing import IO, Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 # from tempfile import TemporaryDirectory
 # from zipfile import ZipFile
 
+BLOCK_SIZE = 512
+
+decompressors: Dict[str, Callable[..., IO[Any]]] = {
+    'gzip': gzip.open,
+    'bzip2': bz2.open,
+    'xz': lzma.open,
+}
+
+
+class ArchiveMember(NamedTuple):
+    """Locate regular file within uncompressed tarball."""
+
+    name: str
+    offset: int
+    size: int
+    mode: int
+
 
 class Archive:
     """Manage artifact packaging."""
@@ -24,6 +48,193 @@ class Archive:
     def _unpack_zipfile(self, path: str) -> None:
         pass
 
+    @staticmethod
+    def __get_number(field: bytes) -> int:
+        """Get number from octal or base-256 tar header field."""
+        if field[0] & 0x80:
+            return int.from_bytes(field[1:], 'big')
+        value = field.split(b'\0', 1)[0].strip()
+        return int(value, 8) if value else 0
+
+    @staticmethod
+    def __get_string(field: bytes) -> str:
+        """Get null terminated string from tar header field."""
+        return field.split(b'\0', 1)[0].decode('utf-8', 'surrogateescape')
+
+    @staticmethod
+    def __get_pax_headers(data: bytes) -> Dict[str, str]:
+        """Get extended header records."""
+        headers = {}
+        while data:
+            length, _, rest = data.partition(b' ')
+            if not length.isdigit():
+                break
+            record = rest[:int(length) - len(length) - 2]
+            key, _, value = record.partition(b'=')
+            headers[key.decode('utf-8')] = value.decode(
+                'utf-8', 'surrogateescape'
+            )
+            data = data[int(length):]
+        return headers
+
+    def __scan(self, path: str) -> List[ArchiveMember]:
+        """Scan tar headers of memory-mapped tarball."""
+        members: List[ArchiveMember] = []
+        if os.path.getsize(path) == 0:
+            return members
+
+        with open(path, 'rb') as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            position = 0
+            overrides: Dict[str, str] = {}
+            while position + BLOCK_SIZE <= len(mm):
+                header = mm[position:position + BLOCK_SIZE]
+                if header.count(0) == BLOCK_SIZE:
+                    break
+
+                typeflag = header[156:157]
+                size = int(
+                    overrides.get('size', self.__get_number(header[124:136]))
+                )
+                offset = position + BLOCK_SIZE
+                position = offset + -(-size // BLOCK_SIZE) * BLOCK_SIZE
+
+                if typeflag == b'L':
+                    overrides['path'] = self.__get_string(
+                        mm[offset:offset + size]
+                    )
+                elif typeflag == b'x':
+                    overrides.update(
+                        self.__get_pax_headers(mm[offset:offset + size])
+                    )
+                elif typeflag in (b'g', b'K'):
+                    continue
+                else:
+                    name = self.__get_string(header[0:100])
+                    prefix = self.__get_string(header[345:500])
+                    if header[257:262] == b'ustar' and prefix:
+                        name = f"{prefix}/{name}"
+                    if typeflag in (b'0', b'\0', b'7'):
+                        members.append(
+                            ArchiveMember(
+                                name=overrides.get('path', name),
+                                offset=offset,
+                                size=size,
+                                mode=self.__get_number(header[100:108]),
+                            )
+                        )
+                    overrides = {}
+        return members
+
+    @staticmethod
+    def is_tarball(path: str) -> bool:
+        """Check if path is a tarball that can be indexed."""
+        return mimetypes.guess_type(path)[0] == 'application/x-tar'
+
+    def decompress(self, path: str, dest: Optional[str] = None) -> str:
+        """Decompress tarball once returning path to uncompressed tarball."""
+        encoding = mimetypes.guess_type(path)[1]
+        if encoding not in decompressors:
+            return path
+
+        if not dest:
+            root = os.path.splitext(path)[0]
+            dest = root if root.endswith('.tar') else f"{root}.tar"
+        if (
+            not os.path.isfile(dest)
+            or os.path.getmtime(dest) < os.path.getmtime(path)
+        ):
+            fd, temp_path = mkstemp(
+                dir=os.path.dirname(os.path.abspath(dest)),
+                prefix='.',
+                suffix='.part',
+            )
+            try:
+                with decompressors[encoding](path, 'rb') as source, \
+                        os.fdopen(fd, 'wb') as target:
+                    shutil.copyfileobj(source, target)
+                os.replace(temp_path, dest)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        return dest
+
+    def index(self, path: str) -> Dict[str, ArchiveMember]:
+        """Get member index of uncompressed tarball.
+
+        The index is persisted alongside the tarball and reused until the
+        tarball changes.
+
+        """
+        stat = os.stat(path)
+        key: Tuple[int, int] = (stat.st_size, stat.st_mtime_ns)
+        index_path = f"{path}.index.json"
+        if os.path.isfile(index_path):
+            try:
+                with open(index_path, 'r') as f:
+                    data = json.load(f)
+                if tuple(data['key']) == key:
+                    return {
+                        x[0]: ArchiveMember(*x) for x in data['members']
+                    }
+            except (KeyError, TypeError, ValueError):
+                # rescan truncated or corrupt index
+                pass
+
+        members = self.__scan(path)
+        fd, temp_path = mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)),
+            prefix='.',
+            suffix='.part',
+        )
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'key': key, 'members': members}, f)
+        os.replace(temp_path, index_path)
+        return {x.name: x for x in members}
+
+    def get_members(self, path: str) -> List[str]:
+        """List regular files within tarball."""
+        return list(self.index(self.decompress(path)))
+
+    def extract_member(self, path: str, name: str, dest: str = '.') -> str:
+        """Extract single regular file from tarball."""
+        path = self.decompress(path)
+        member = self.index(path).get(name)
+        if not member:
+            raise KeyError(f"member not found in archive: {name}")
+
+        dest_path = os.path.join(dest, os.path.basename(member.name))
+        os.makedirs(dest, exist_ok=True)
+        with open(dest_path, 'wb') as target:
+            if member.size:
+                with open(path, 'rb') as f, mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mm, memoryview(mm) as view:
+                    target.write(
+                        view[member.offset:member.offset + member.size]
+                    )
+        os.chmod(dest_path, member.mode & 0o7777)
+        return dest_path
+
+    def unpack_executables(self, path: str, dest: str = '.') -> None:
+        """Extract only executable members of tarball.
+
+        Members are selected by mode from the index, falling back to a full
+        unpack when the archive is not a tarball or marks no executables.
+
+        """
+        if self.is_tarball(path):
+            tarball = self.decompress(path)
+            members = [
+                x for x in self.index(tarball).values() if x.mode & 0o111
+            ]
+            if members:
+                for member in members:
+                    self.extract_member(tarball, member.name, dest)
+                return
+        self.unpack(path, dest)
+
     def pack(self, path: str) -> None:
         """Pack archive."""
         pass
@@ -0,0 +1,110 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: LGPL-3.0, see LICENSE.md for more details.
+"""Provide asyncio package manager capabilities using GitHub."""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+
+from proman_github.package_manager import PackageManager
+
+T = TypeVar('T')
+
+
+class AsyncPackageManager:
+    """Provide asyncio package manager for GitHub releases.
+
+    Blocking GitHub API requests, downloads, archive extraction and file
+    type detection run in a bounded thread pool so the event loop is never
+    blocked while many installs are in progress.
+
+    """
+
+    def __init__(
+        self,
+        package_manager: Optional[PackageManager] = None,
+        **options: Any,
+    ) -> None:
+        """Initialize asyncio GitHub package manager."""
+        self.__package_manager = package_manager or PackageManager(**options)
+        executor: Optional[Executor] = options.get('executor')
+        # only shut down worker threads created here
+        self.__shutdown = executor is None
+        self.__executor = executor or ThreadPoolExecutor(
+            max_workers=options.get('jobs', 32)
+        )
+
+    async def __aenter__(self) -> 'AsyncPackageManager':
+        """Provide package manager for context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Release worker threads for context."""
+        # wait for running jobs without blocking the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __run(
+        self, function: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run blocking function in worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.__executor, partial(function, *args, **kwargs)
+        )
+
+    def close(self) -> None:
+        """Release worker threads."""
+        if self.__shutdown:
+            self.__executor.shutdown(wait=True)
+
+    async def install(self, *packages: Any, **options: Any) -> None:
+        """Install GitHub releases concurrently.
+
+        Manifest changes of every package are committed in a single write
+        once all installs succeed.
+
+        """
+        results = await asyncio.gather(
+            *[
+                self.__run(
+                    self.__package_manager._install_package,
+                    package,
+                    **options,
+                )
+                for package in packages
+            ]
+        )
+        changes = [x for result in results for x in result]
+        if changes:
+            await self.__run(self.__package_manager._commit, changes)
+
+    async def uninstall(self, *packages: Any, **options: Any) -> None:
+        """Perform package uninstall."""
+        await self.__run(
+            self.__package_manager.uninstall, *packages, **options
+        )
+
+    async def search(
+        self, query: str, **options: Any
+    ) -> List[Dict[str, Any]]:
+        """Perform package search."""
+        return await self.__run(
+            self.__package_manager.search, query, **options
+        )
+
+    async def info(self, name: str, output: str) -> Dict[str, Any]:
+        """Retrieve package information."""
+        return await self.__run(self.__package_manager.info, name, output)
+
+    async def download(self, package: str, dest: str, **options: Any) -> None:
+        """Download package."""
+        await self.__run(
+            self.__package_manager.download, package, dest, **options
+        )
@@ -0,0 +1,45 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: LGPL-3.0, see LICENSE.md for more details.
+"""Provide short-lived cache for API results."""
+
+import hashlib
+import json
+import os
+import time
+from tempfile import mkstemp
+from typing import Any, Optional
+
+
+class ResultCache:
+    """Manage JSON serializable results cached for a limited time."""
+
+    def __init__(self, path: str, ttl: float = 300) -> None:
+        """Initialize result cache."""
+        self.path = path
+        self.ttl = ttl
+
+    def __get_path(self, key: str) -> str:
+        """Get cache path for key."""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, f"{digest}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached result unless expired."""
+        cache_path = self.__get_path(key)
+        try:
+            if time.time() - os.path.getmtime(cache_path) < self.ttl:
+                with open(cache_path, 'r') as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache result."""
+        if self.ttl <= 0:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        fd, temp_path = mkstemp(dir=self.path, prefix='.', suffix='.part')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(value, f)
+        os.replace(temp_path, self.__get_path(key))
@@ -48,13 +48,63 @@ def install(*packages: str, **options: Any) -> None:
         optional package that is not required
     platform: str
         restrict package to specific platform
+    scope: str
+        install to either 'global', 'user', 'virtualenv', or 'project'
+    version: str
+        release to install, defaults to the version pinned in the manifest
+        or the latest release
+    targets: str
+        comma separated platform/architecture targets to also lock
 
     """
     package_manager.install(*packages, **options)
 
 
+def lock(*packages: str, **options: Any) -> None:
+    """Lock package assets for multiple platforms.
+
+    Parameters
+    ----------
+    package: str
+        package of package to be locked
+    version: str
+        release version to lock
+    targets: str
+        comma separated platform/architecture targets, e.g.
+        'linux/amd64,linux/arm64,darwin/arm64'
+
+    """
+    package_manager.lock(*packages, **options)
+
+
+def prefetch(*targets: str, **options: Any) -> None:
+    """Download manifest dependencies ahead of install.
+
+    Later installs of the pinned manifest versions are served from the
+    local store without the GitHub API.
+
+    Parameters
+    ----------
+    targets: str
+        platform/architecture targets to download for, e.g. 'linux/amd64'
+    jobs: int
+        number of concurrent downloads
+
+    """
+    package_manager.prefetch(*targets, **options)
+
+
 def uninstall(*packages: str, **options: Any) -> None:
-    """Uninstall packages."""
+    """Uninstall packages.
+
+    Parameters
+    ----------
+    package: str
+        package of package to be uninstalled
+    scope: str
+        uninstall from either 'global', 'user', 'virtualenv', or 'project'
+
+    """
     package_manager.uninstall(*packages, **options)
 
 
@@ -93,8 +143,19 @@ def search(*query: str, **options: str) -> None:
         or 'updated'.
     order: str, optional
         Order the result either 'asc' or 'desc'.
+    limit: int, optional
+        Maximum number of results to return.
+    installable: bool, optional
+        Only return projects with a release asset for the targets.
+    targets: str, optional
+        Comma separated platform/architecture targets to check.
 
     """
     packages = package_manager.search(query=' '.join(query), **options)
     for package in packages:
-        print(package, file=sys.stdout)
+        print(
+            package['name'].ljust(40),
+            package.get('version', '').ljust(15),
+            package['description'] or '',
+            file=sys.stdout,
+        )
@@ -11,6 +11,21 @@ if TYPE_CHECKING:
     from proman_common.manifest import LockFile, SourceTreeFile
 
 url_base = os.getenv('PROMAN_GITHUB_URL', 'https://api.github.com')
+store_dir = os.getenv('PROMAN_GITHUB_STORE', None)
+search_ttl = float(os.getenv('PROMAN_GITHUB_SEARCH_TTL', 300))
+download_timeout = float(os.getenv('PROMAN_GITHUB_TIMEOUT', 60))
+
+install_scopes = ('global', 'user', 'virtualenv', 'project')
+
+arch_names = {'x86_64': 'amd64', 'aarch64': 'arm64'}
+
+target_aliases = {
+    'darwin': ('darwin', 'macos', 'osx'),
+    'amd64': ('amd64', 'x86_64'),
+    'x86_64': ('x86_64', 'amd64'),
+    'arm64': ('arm64', 'aarch64'),
+    'aarch64': ('aarch64', 'arm64'),
+}
 
 
 @dataclass
@@ -21,10 +36,21 @@ class ProjectPaths:
     virtualenv_dir: Optional[str] = os.getenv('VIRTUAL_ENV', None)
     pyproject_path: str = field(init=False)
     lock_path: str = field(init=False)
+    manifest_lock_path: str = field(init=False)
     pypackages_dir: str = field(init=False)
+    pypackages_bin_dir: str = field(init=False)
+    virtualenv_bin_dir: Optional[str] = field(init=False)
 
     def __post_init__(self) -> None:
         '''Initialize python project.'''
         self.pyproject_path = os.path.join(self.working_dir, 'pyproject.toml')
         self.lock_path = os.path.join(self.working_dir, 'proman-lock.json')
+        self.manifest_lock_path = f"{self.lock_path}.lock"
         self.pypackages_dir = os.path.join(self.working_dir, '__pypackages__')
+        self.pypackages_bin_dir = os.path.join(self.pypackages_dir, 'bin')
+        if self.virtualenv_dir:
+            self.virtualenv_bin_dir = os.path.join(
+                self.virtualenv_dir, 'Scripts' if os.name == 'nt' else 'bin'
+            )
+        else:
+            self.virtualenv_bin_dir = None
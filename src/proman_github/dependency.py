@@ -3,7 +3,7 @@
 """Resolve package dependencies."""
 
 import re
-from typing import Any, Dict, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 
 # from packaging.specifiers import SpecifierSet
 from proman_common.dependencies import DependencyBase
@@ -27,6 +27,8 @@ class Dependency(DependencyBase):
         self.__platform = options.get('platform', None)
         self.__optional = options.get('optional', False)
         self.__prerelease = options.get('prerelease', False)
+        self.__target = options.get('target', None)
+        self.__package: str = options.get('package', asset.name)
 
     def __getattr__(self, attr: str) -> Any:
         """Provide proxy for distribution."""
@@ -49,11 +51,31 @@ class Dependency(DependencyBase):
         """Get name."""
         return self._asset.name
 
+    @property
+    def package(self) -> str:
+        """Get package name the asset was released for."""
+        return self.__package
+
+    @property
+    def is_dev(self) -> bool:
+        """Check if dependency for development."""
+        return self.__dev
+
+    @is_dev.setter
+    def is_dev(self, dev: bool) -> None:
+        """Set dependency for development or release."""
+        self.__dev = dev
+
     @property
     def version(self) -> str:
         """Get version."""
         return self.__version
 
+    @property
+    def target(self) -> Optional[str]:
+        """Get platform and architecture target."""
+        return self.__target
+
     @property
     def digests(self) -> Tuple[Dict[str, str]]:
         """Get digests."""
@@ -0,0 +1,96 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: LGPL-3.0, see LICENSE.md for more details.
+"""Provide cross-process file locks."""
+
+import os
+import sys
+import time
+from types import TracebackType
+from typing import IO, Any, Optional, Type
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """Manage exclusive advisory lock on a file.
+
+    Locks are held on an open file description, so they exclude other
+    processes as well as other threads that open the same lock path.
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        interval: float = 0.05,
+    ) -> None:
+        """Initialize file lock."""
+        self.path = path
+        self.timeout = timeout
+        self.interval = interval
+        self.__file: Optional[IO[Any]] = None
+
+    @property
+    def is_locked(self) -> bool:
+        """Check if lock is held."""
+        return self.__file is not None
+
+    def __try_lock(self, fileobj: IO[Any]) -> bool:
+        """Attempt to lock file without blocking."""
+        try:
+            if sys.platform == 'win32':
+                fileobj.seek(0)
+                msvcrt.locking(fileobj.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fileobj.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    def acquire(self) -> None:
+        """Acquire lock waiting until timeout."""
+        if self.is_locked:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        fileobj = open(self.path, 'a+')
+        start = time.monotonic()
+        while not self.__try_lock(fileobj):
+            if (
+                self.timeout is not None
+                and time.monotonic() - start >= self.timeout
+            ):
+                fileobj.close()
+                raise TimeoutError(f"unable to acquire lock: {self.path}")
+            time.sleep(self.interval)
+        self.__file = fileobj
+
+    def release(self) -> None:
+        """Release lock."""
+        if self.__file:
+            try:
+                if sys.platform == 'win32':
+                    self.__file.seek(0)
+                    msvcrt.locking(self.__file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(self.__file.fileno(), fcntl.LOCK_UN)
+            finally:
+                self.__file.close()
+                self.__file = None
+
+    def __enter__(self) -> 'FileLock':
+        """Acquire lock for context."""
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Release lock for context."""
+        self.release()
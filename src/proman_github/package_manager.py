@@ -1,28 +1,60 @@
 """Provide package manager capabilities using GitHub."""
+import json
 import os
 import platform
 import shutil
-from tempfile import TemporaryDirectory
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import sysconfig
+import threading
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from tempfile import mkdtemp, mkstemp
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 from urllib.request import Request, urlopen
 
 import magic
-from github import Github
+from github import Github, GithubException
 from proman_common.packaging_bases import PackageManagerBase
 from proman_common.filepaths import GlobalDirs
 
-# from proman_github import config
+from proman_github import config
 # from proman_github import filesystem
 from proman_github.archive import Archive
+from proman_github.cache import ResultCache
 from proman_github.dependency import Dependency
+from proman_github.lock import FileLock
+from proman_github.store import AssetStore
 
 if TYPE_CHECKING:
     from github.GithubReleaseAsset import GithubReleaseAsset
     from github.GitRelease import GitRelease
+    from github.Repository import Repository
     from github.PaginatedList import PaginatedList
     from proman_github.manifest import Manifest
 
 
+class _ManifestEntry(NamedTuple):
+    """Identify package tracked in the manifest by name."""
+
+    name: str
+    is_dev: bool
+    version: str = 'latest'
+    digests: Tuple[Dict[str, str], ...] = ({},)
+
+
 class PackageManager(PackageManagerBase):
     """Proide package manager for GitHub releases."""
 
@@ -35,13 +67,35 @@ class PackageManager(PackageManagerBase):
     ) -> None:
         """Initialize GitHub package manager."""
         self.__manifest = manifest
+        self.__manifest_loader: Optional[
+            Callable[[config.ProjectPaths], Optional['Manifest']]
+        ] = options.get('manifest_loader', None)
+        self.__local = threading.local()
         self.__arch: str = options.get('arch', platform.machine().lower())
         self.__platform: str = (
-            options.get('platorm', platform.system().lower())
+            options.get('platform', platform.system().lower())
         )
         self.__dirs = options.get('dirs', GlobalDirs())
         self.__github = options.get('github', Github())
         self.__archive = options.get('archive', Archive())
+        self.__paths = options.get('paths', config.ProjectPaths())
+        self.__scope: str = options.get('scope', 'global')
+        self.__store = options.get(
+            'store',
+            AssetStore(
+                config.store_dir
+                or os.path.join(
+                    self.__dirs.cache_dir, 'proman-github', 'assets'
+                )
+            ),
+        )
+        self.__search_cache = options.get(
+            'search_cache',
+            ResultCache(
+                os.path.join(self.__dirs.cache_dir, 'proman-github', 'search'),
+                ttl=config.search_ttl,
+            ),
+        )
 
     def __get_release(
         self,
@@ -64,113 +118,534 @@ class PackageManager(PackageManagerBase):
                         .get_release(id=release.id)
         return release
 
-    def __get_asset(
+    @property
+    def host_target(self) -> str:
+        """Get platform and architecture target of this host."""
+        arch = config.arch_names.get(self.__arch, self.__arch)
+        return f"{self.__platform}/{arch}"
+
+    @staticmethod
+    def __get_target(target: str) -> Tuple[str, str]:
+        """Get platform and architecture from target."""
+        if '/' not in target:
+            raise Exception('target requires both platform and architecture')
+        system, arch = target.lower().split('/', 1)
+        return system, arch
+
+    def __get_targets(self, targets: Any = None) -> List[str]:
+        """Get unique targets from list or comma separated string."""
+        if not targets:
+            return [self.host_target]
+        if isinstance(targets, str):
+            targets = targets.split(',')
+        # use one name per architecture so stored releases are shared
+        return list(
+            dict.fromkeys(
+                f"{system}/{config.arch_names.get(arch, arch)}"
+                for system, arch in (
+                    self.__get_target(x.strip()) for x in targets
+                )
+            )
+        )
+
+    def __is_exact(self, asset: Any, target: str) -> bool:
+        """Check if asset matches both platform and architecture."""
+        name = asset.name.lower()
+        return all(
+            any(x and x in name for x in config.target_aliases.get(y, (y,)))
+            for y in self.__get_target(target)
+        )
+
+    def __get_assets(
         self,
         assets: 'PaginatedList',
+        targets: List[str],
         archive: Optional[str] = None,
-        arch: Optional[str] = None,
         suffix: Optional[str] = None,
-    ) -> Optional['GithubReleaseAsset']:
-        """Get archive for platform or architecture."""
-        match = None
-        weight = 0
-        asset_names = [x.name for x in assets]
+        strict: Optional[Collection[str]] = None,
+    ) -> Dict[str, 'GithubReleaseAsset']:
+        """Get best archive for each platform and architecture target.
+
+        Assets of strict targets, which default to all targets when there
+        are several, must match both the platform and architecture so that
+        targets without a release asset are left unresolved.
+
+        """
+        if strict is None:
+            strict = targets if len(targets) > 1 else ()
+        aliases = {
+            target: tuple(
+                config.target_aliases.get(x, (x,))
+                for x in self.__get_target(target)
+            )
+            for target in targets
+        }
+        matches: Dict[str, 'GithubReleaseAsset'] = {}
+        weights = {target: 0 for target in targets}
+        # score every target in a single pass over the release assets
         for asset in assets:
-            asset_weight = 0
-            if archive and archive in asset_names:
-                return asset
+            if archive:
+                if asset.name == archive:
+                    return {target: asset for target in targets}
             elif (
                 asset.content_type == 'application/octet-stream'
                 or asset.content_type == 'application/gzip'
                 or asset.content_type == 'application/zip'
             ):
-                if self.__platform != '' and self.__platform in asset.name:
-                    asset_weight += 2
-                if self.__arch and self.__arch in asset.name:
-                    asset_weight += 1
-                if suffix and asset.name.endswith(suffix):
-                    asset_weight += 1
-                if asset_weight > weight:
-                    match = asset
-                    weight = asset_weight
-        return match
+                name = asset.name.lower()
+                for target, (systems, arches) in aliases.items():
+                    asset_weight = 0
+                    system_match = any(x and x in name for x in systems)
+                    arch_match = any(x and x in name for x in arches)
+                    if target in strict and not (system_match and arch_match):
+                        continue
+                    if system_match:
+                        asset_weight += 2
+                    if arch_match:
+                        asset_weight += 1
+                    if suffix and name.endswith(suffix):
+                        asset_weight += 1
+                    if asset_weight > weights[target]:
+                        matches[target] = asset
+                        weights[target] = asset_weight
+        return matches
+
+    def _get_dependencies(
+        self,
+        package: str,
+        version: str = 'latest',
+        dev: bool = False,
+        targets: Any = None,
+        strict: Optional[Collection[str]] = None,
+    ) -> Dict[str, Dependency]:
+        """Lookup dependency for each target from a single release."""
+        targets = self.__get_targets(targets)
+        if strict is None:
+            strict = targets if len(targets) > 1 else ()
+        dependencies: Dict[str, Dependency] = {}
+        if version != 'latest':
+            # pinned releases resolved before are available offline
+            for target in targets:
+                stored_asset = self.__store.get_release_asset(
+                    package, version, target
+                )
+                if stored_asset and (
+                    stored_asset.exact or target not in strict
+                ):
+                    dependencies[target] = Dependency(
+                        stored_asset,
+                        package=package,
+                        version=stored_asset.tag_name,
+                        dev=dev,
+                        target=target,
+                    )
+            targets = [x for x in targets if x not in dependencies]
+            if not targets:
+                return dependencies
 
-    def _get_dependency(
-        self, package: str, version: str = 'latest', dev: bool = False
-    ) -> Optional[Dependency]:
-        """Lookup dependency."""
         release = self.__get_release(package, version=version)
         if release:
-            asset = self.__get_asset(release.get_assets())
-            if asset:
-                dependency = Dependency(
+            assets = self.__get_assets(
+                release.get_assets(), targets, strict=strict
+            )
+            for target, asset in assets.items():
+                self.__store.add_release_asset(
+                    package,
+                    release.tag_name,
+                    target,
+                    asset,
+                    exact=self.__is_exact(asset, target),
+                )
+                dependencies[target] = Dependency(
                     asset,
+                    package=package,
                     version=release.tag_name,
-                    dev=dev
+                    dev=dev,
+                    target=target,
                 )
-                return dependency
-        return None
+        return dependencies
 
-    def _unpack_archive(self, path: str, dest: str) -> List[str]:
-        """Unpack tarball."""
-        os.makedirs(dest)
-        self.__archive.unpack(path, dest)
-        return os.listdir(dest)
+    def _get_dependency(
+        self,
+        package: str,
+        version: str = 'latest',
+        dev: bool = False,
+        target: Optional[str] = None,
+    ) -> Optional[Dependency]:
+        """Lookup dependency."""
+        target = target or self.host_target
+        return self._get_dependencies(
+            package=package, version=version, dev=dev, targets=[target]
+        ).get(target)
 
-    def __install_executable(self, executable: str, source_path: str) -> None:
-        """Install executable."""
-        executable_path = os.path.join(self.__dirs.executable_dir, executable)
-        if not os.path.exists(executable_path):
-            os.makedirs(self.__dirs.executable_dir, exist_ok=True)
-            shutil.move(source_path, executable_path)
-            if os.name == 'posix':
-                st = os.stat(executable_path)
-                os.chmod(executable_path, st.st_mode | 0o111)
+    def __get_executable_dir(self, scope: Optional[str] = None) -> str:
+        """Get executable directory for install scope."""
+        scope = scope or self.__scope
+        if scope == 'global':
+            executable_dir = self.__dirs.executable_dir
+        elif scope == 'user':
+            executable_dir = sysconfig.get_path('scripts', f"{os.name}_user")
+        elif scope == 'virtualenv':
+            executable_dir = self.__paths.virtualenv_bin_dir
+        elif scope == 'project':
+            executable_dir = self.__paths.pypackages_bin_dir
         else:
+            raise Exception(
+                f"scope must be one of: {', '.join(config.install_scopes)}"
+            )
+        if not executable_dir:
+            raise Exception(f"no executable directory for scope: {scope}")
+        return executable_dir
+
+    def __install_executable(
+        self, executable: str, source_path: str, executable_dir: str
+    ) -> None:
+        """Install executable."""
+        executable_path = os.path.join(executable_dir, executable)
+        if os.path.exists(executable_path):
             print('already installed:', executable)
+            return
 
-    def _install_asset(self, source_path: str, filename: str) -> None:
-        """Install package."""
-        # handle download
+        with self.__store.get_lock(
+            f"executable:{os.path.abspath(executable_path)}"
+        ):
+            if os.path.exists(executable_path):
+                print('already installed:', executable)
+                return
+
+            os.makedirs(executable_dir, exist_ok=True)
+            # copy from the shared store so other scopes can reuse the asset
+            fd, temp_path = mkstemp(dir=executable_dir, prefix=f".{executable}")
+            os.close(fd)
+            try:
+                shutil.copy2(source_path, temp_path)
+                if os.name == 'posix':
+                    st = os.stat(temp_path)
+                    os.chmod(temp_path, st.st_mode | 0o111)
+                os.replace(temp_path, executable_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    @contextmanager
+    def __lock_manifest(self) -> Iterator[None]:
+        """Lock project manifest and reload it from disk."""
+        # lock within the project so jobs with different stores exclude
+        with FileLock(self.__paths.manifest_lock_path):
+            if self.__manifest_loader:
+                # pick up changes written by other processes while unlocked
+                self.__manifest = self.__manifest_loader(self.__paths)
+            yield
+
+    def __snapshot_manifest(self) -> Dict[str, Optional[bytes]]:
+        """Capture manifest files before they are written."""
+        snapshot: Dict[str, Optional[bytes]] = {}
+        for path in (self.__paths.pyproject_path, self.__paths.lock_path):
+            if os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    snapshot[path] = f.read()
+            else:
+                snapshot[path] = None
+        return snapshot
+
+    def __restore_manifest(self, snapshot: Dict[str, Optional[bytes]]) -> None:
+        """Restore manifest files from snapshot."""
+        for path, data in snapshot.items():
+            if data is None:
+                if os.path.isfile(path):
+                    os.remove(path)
+                continue
+            fd, temp_path = mkstemp(
+                dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}"
+            )
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+
+    @staticmethod
+    def __apply_changes(
+        manifest: 'Manifest',
+        changes: Sequence[Tuple[str, Union[Dependency, _ManifestEntry]]],
+    ) -> None:
+        """Apply staged changes to manifest.
+
+        Entries are keyed by package name with the release asset of each
+        target recorded in the lock of the package.
+
+        """
+        for action, dependency in changes:
+            if isinstance(dependency, _ManifestEntry):
+                manifest.specfile.remove_dependency(dependency)
+                manifest.lockfile.remove_lock(dependency)
+                continue
+            entry = _ManifestEntry(
+                dependency.package, dependency.is_dev, dependency.version
+            )
+            if action == 'add':
+                manifest.specfile.remove_dependency(entry)
+                manifest.specfile.add_dependency(entry)
+            lock = manifest.lockfile.get_lock(entry.name, entry.is_dev)
+            assets = dict(
+                lock.get('assets', {})
+                if lock.get('version') == entry.version
+                else {}
+            )
+            assets[dependency.target] = {
+                'name': dependency.name,
+                'id': dependency.id,
+                'url': dependency.url,
+            }
+            manifest.lockfile.remove_lock(entry)
+            manifest.lockfile.add_lock(entry, assets=assets)
+
+    def __replace_manifest(
+        self,
+        manifest_loader: Callable[[config.ProjectPaths], Optional['Manifest']],
+        changes: Sequence[Tuple[str, Union[Dependency, _ManifestEntry]]],
+    ) -> None:
+        """Write changes to copies of manifest files then swap them in."""
+        staging_dir = mkdtemp(dir=self.__paths.working_dir, prefix='.proman-')
+        try:
+            paths = config.ProjectPaths(working_dir=staging_dir)
+            staged = {
+                self.__paths.pyproject_path: paths.pyproject_path,
+                self.__paths.lock_path: paths.lock_path,
+            }
+            for path, staged_path in staged.items():
+                if os.path.isfile(path):
+                    shutil.copy2(path, staged_path)
+            manifest = manifest_loader(paths)
+            if not manifest:
+                raise Exception('unable to stage project manifest')
+            self.__apply_changes(manifest, changes)
+            manifest.save()
+            for path, staged_path in staged.items():
+                if os.path.isfile(staged_path):
+                    os.replace(staged_path, path)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def _commit(
+        self,
+        changes: Sequence[Tuple[str, Union[Dependency, _ManifestEntry]]],
+    ) -> None:
+        """Write staged manifest changes at once.
+
+        Changes are saved to copies of the manifest files which replace
+        the originals, so an interrupted write never leaves them partial.
+
+        """
+        with self.__lock_manifest():
+            if not self.__manifest:
+                return
+            snapshot = self.__snapshot_manifest()
+            try:
+                if self.__manifest_loader:
+                    self.__replace_manifest(self.__manifest_loader, changes)
+                else:
+                    # without a loader the manifest is written in place
+                    self.__apply_changes(self.__manifest, changes)
+                    self.__manifest.save()
+            except Exception:
+                self.__restore_manifest(snapshot)
+                raise
+            finally:
+                if self.__manifest_loader:
+                    self.__manifest = self.__manifest_loader(self.__paths)
+
+    def __stage(
+        self, action: str, dependency: Union[Dependency, _ManifestEntry]
+    ) -> None:
+        """Stage manifest change for the current transaction."""
+        changes = getattr(self.__local, 'changes', None)
+        if changes is None:
+            self._commit([(action, dependency)])
+        else:
+            changes.append((action, dependency))
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Batch manifest changes into a single write.
+
+        Changes staged by `install`, `uninstall` and `update` are written
+        to the specfile and lockfile together when the outermost transaction
+        exits, and discarded if it fails. Transactions are tracked per
+        thread and nested transactions join the outermost one.
+
+        """
+        if getattr(self.__local, 'changes', None) is not None:
+            yield
+            return
+
+        self.__local.changes = []
+        try:
+            yield
+            if self.__local.changes:
+                self._commit(self.__local.changes)
+        finally:
+            self.__local.changes = None
+
+    def __prepare_asset(self, dependency: Dependency) -> List[str]:
+        """Download and unpack asset returning executables in store."""
+        source_path = self.__store.add_asset(dependency, self.__download)
         mimetype = magic.from_file(source_path, mime=True)
         if mimetype == 'application/x-executable':
-            self.__install_executable(filename, source_path)
-        else:
-            contents_dir = os.path.join(
-                os.path.dirname(source_path), 'contents'
+            return [source_path]
+
+        executables = []
+        contents_dir = self.__store.unpack_asset(
+            dependency, self.__archive.unpack_executables
+        )
+        for path in os.listdir(contents_dir):
+            contents_file = os.path.join(contents_dir, path)
+            if os.path.isfile(contents_file):
+                mimetype = magic.from_file(contents_file, mime=True)
+                if mimetype == 'application/x-executable':
+                    executables.append(contents_file)
+        return executables
+
+    def _install_asset(
+        self, dependency: Dependency, filename: str, executable_dir: str
+    ) -> None:
+        """Install package."""
+        for source_path in self.__prepare_asset(dependency):
+            self.__install_executable(filename, source_path, executable_dir)
+
+    def prefetch(self, *targets: str, **options: Any) -> None:
+        """Download manifest dependencies into local store."""
+        jobs = options.get('jobs', 8)
+        if not self.__manifest:
+            raise Exception('prefetch requires a project manifest')
+
+        packages: Dict[str, str] = {}
+        for dev in (False, True):
+            packages.update(
+                self.__manifest.specfile.get_dependencies(dev) or {}
             )
-            contents = self._unpack_archive(source_path, contents_dir)
-            for path in contents:
-                contents_file = os.path.join(contents_dir, path)
-                if os.path.isfile(contents_file):
-                    mimetype = magic.from_file(contents_file, mime=True)
-                    if mimetype == 'application/x-executable':
-                        self.__install_executable(filename, contents_file)
 
-    def install(self, *packages: Any, **options: Any) -> None:
-        """Install GitHub release."""
-        version = options.get('version', 'latest')
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            # resolve all targets of each package from one release lookup
+            resolutions = {
+                package: executor.submit(
+                    self._get_dependencies,
+                    package=package,
+                    version=version,
+                    targets=list(targets),
+                )
+                for package, version in packages.items()
+            }
+            downloads = []
+            for package, resolution in resolutions.items():
+                try:
+                    dependencies = resolution.result()
+                except Exception as err:
+                    print('unable to resolve:', package, err)
+                    continue
+                for target in self.__get_targets(targets):
+                    if target not in dependencies:
+                        print('no asset found:', package, target)
+                        continue
+                    if target == self.host_target:
+                        download = executor.submit(
+                            self.__prepare_asset, dependencies[target]
+                        )
+                    else:
+                        download = executor.submit(
+                            self.__store.add_asset,
+                            dependencies[target],
+                            self.__download,
+                        )
+                    downloads.append((package, target, download))
+            for package, target, download in downloads:
+                try:
+                    download.result()
+                except Exception as err:
+                    print('unable to download:', package, target, err)
+
+    def lock(self, *packages: Any, **options: Any) -> None:
+        """Lock GitHub release assets for each target without install."""
+        version = options.get('version') or 'latest'
         dev = options.get('dev', False)
-        # force = options.get('force', False)
+        targets = self.__get_targets(options.get('targets'))
 
-        for package in list(packages):
-            if '/' in package:
-                filename = package.split('/')[1]
-            else:
-                raise Exception('package requires both group and project')
+        with self.transaction():
+            for package in packages:
+                dependencies = self._get_dependencies(
+                    package=package, version=version, dev=dev, targets=targets
+                )
+                for target in targets:
+                    if target in dependencies:
+                        self.__stage('lock', dependencies[target])
+                    else:
+                        print('no asset found:', package, target)
 
-            dependency = self._get_dependency(
-                package=package, version=version, dev=dev
+    def __get_version(self, package: str, dev: bool = False) -> str:
+        """Get version pinned in manifest or latest release."""
+        if self.__manifest:
+            pinned = self.__manifest.specfile.get_dependency(
+                name=package, dev=dev
             )
-            if dependency:
-                with TemporaryDirectory() as temp_dir:
-                    filepath = os.path.join(temp_dir, dependency.name)
-                    self.__download(dependency, filepath)
-                    self._install_asset(
-                        source_path=filepath, filename=filename
-                    )
-                if self.__manifest:
-                    self.__manifest.add_dependency(dependency)
+            if package in pinned:
+                return pinned[package]
+        return 'latest'
+
+    def _install_package(
+        self, package: str, **options: Any
+    ) -> List[Tuple[str, Dependency]]:
+        """Install GitHub release returning manifest changes to commit."""
+        version = options.get('version')
+        dev = options.get('dev', False)
+        executable_dir = self.__get_executable_dir(options.get('scope'))
+
+        targets = self.__get_targets(options.get('targets'))
+        if self.host_target not in targets:
+            targets.insert(0, self.host_target)
+
+        if '/' in package:
+            filename = package.split('/')[1]
+        else:
+            raise Exception('package requires both group and project')
+
+        changes: List[Tuple[str, Dependency]] = []
+        dependencies = self._get_dependencies(
+            package=package,
+            version=version or self.__get_version(package, dev),
+            dev=dev,
+            targets=targets,
+            # install the best host asset even without an architecture
+            strict=[x for x in targets if x != self.host_target],
+        )
+        for target in targets:
+            if target not in dependencies:
+                print('no asset found:', package, target)
+        dependency = dependencies.pop(self.host_target, None)
+        if dependency:
+            self._install_asset(
+                dependency=dependency,
+                filename=filename,
+                executable_dir=executable_dir,
+            )
+            changes.append(('add', dependency))
+        # record assets of other targets for matrix builds
+        changes.extend(('lock', x) for x in dependencies.values())
+        return changes
+
+    def install(self, *packages: Any, **options: Any) -> None:
+        """Install GitHub release.
+
+        Without a version the release pinned in the manifest is installed,
+        which is served from the store without the GitHub API once it has
+        been resolved or prefetched.
+
+        """
+        # force = options.get('force', False)
+        with self.transaction():
+            for package in list(packages):
+                for action, dependency in self._install_package(
+                    package, **options
+                ):
+                    if self.__manifest:
+                        self.__stage(action, dependency)
 
     def __remove_path(self, path: str) -> None:
         """Remove package directory from path."""
@@ -182,25 +657,40 @@ class PackageManager(PackageManagerBase):
         except OSError as err:
             print(f"unable to delete direcotry path due to: {err}")
 
-    def __uninstall_executable(self, executable: str) -> None:
+    def __uninstall_executable(
+        self, executable: str, executable_dir: str
+    ) -> None:
         """Uninstall executable."""
-        executable_path = os.path.join(self.__dirs.executable_dir, executable)
-        if os.path.exists(executable_path):
-            self.__remove_path(executable_path)
-        else:
+        executable_path = os.path.join(executable_dir, executable)
+        if not os.path.exists(executable_path):
             print('already uninstalled:', executable)
+            return
+
+        with self.__store.get_lock(
+            f"executable:{os.path.abspath(executable_path)}"
+        ):
+            if os.path.exists(executable_path):
+                self.__remove_path(executable_path)
+            else:
+                print('already uninstalled:', executable)
 
     def uninstall(self, *packages: Any, **options: Any) -> None:
         """Perform package uninstall."""
         dev = options.get('dev', False)
         # force = options.get('force', False)
+        executable_dir = self.__get_executable_dir(options.get('scope'))
 
         # TODO: janky stop-gap
-        for package in packages:
-            if self.__manifest:
-                self.__manifest.remove_dependency(package, dev)
-            executable = package.split('/')[1] if '/' in package else package
-            self.__uninstall_executable(executable=executable)
+        with self.transaction():
+            for package in packages:
+                if self.__manifest:
+                    self.__stage('remove', _ManifestEntry(package, dev))
+                executable = (
+                    package.split('/')[1] if '/' in package else package
+                )
+                self.__uninstall_executable(
+                    executable=executable, executable_dir=executable_dir
+                )
 
     def update(self, *packages: Any, **options: Any) -> None:
         """Update the package."""
@@ -209,25 +699,103 @@ class PackageManager(PackageManagerBase):
 
         # TODO: janky stop-gap
         if self.__manifest:
-            for package in packages:
-                self.uninstall(package, dev, force)
-                self.install(package, dev, version='latest')
-            else:
-                dependencies = self.__manifest.lockfile.get_locks()
-                print(dependencies)
+            with self.transaction():
+                for package in packages:
+                    self.uninstall(package, dev=dev, force=force)
+                    self.install(package, dev=dev, version='latest')
+                else:
+                    dependencies = self.__manifest.lockfile.get_locks()
+                    print(dependencies)
 
-    def search(self, query: str, **options: Any) -> 'PaginatedList':
+    def __get_installable(
+        self, repo: 'Repository', targets: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get latest release assets of repository for targets."""
+        try:
+            release = repo.get_latest_release()
+            assets = self.__get_assets(
+                release.get_assets(), targets, strict=targets
+            )
+        except GithubException:
+            return None
+        if any(x not in assets for x in targets):
+            return None
+        return {
+            'version': release.tag_name,
+            'assets': {k: v.name for k, v in assets.items()},
+        }
+
+    def search(self, query: str, **options: Any) -> List[Dict[str, Any]]:
         """Perform package search."""
         sort = options.pop('sort', None) or 'stars'
         order = options.pop('order', None) or 'desc'
-        result = self.__github.search_repositories(
-            query=query, sort=sort, order=order, **options
+        limit = options.pop('limit', None)
+        installable = bool(options.pop('installable', False))
+        # release lookups are only made for a bounded number of results
+        limit = int(limit) if limit else (10 if installable else None)
+        targets = self.__get_targets(options.pop('targets', None))
+        jobs = int(options.pop('jobs', None) or 8)
+        if installable:
+            # exclude repositories that can no longer publish releases
+            options.setdefault('archived', 'false')
+
+        key = json.dumps(
+            [query, sort, order, limit, installable, targets, options],
+            sort_keys=True,
         )
-        return result
+        cached = self.__search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        repos = list(
+            islice(
+                self.__github.search_repositories(
+                    query=query, sort=sort, order=order, **options
+                ),
+                limit,
+            )
+        )
+        results = [
+            {
+                'name': repo.full_name,
+                'description': repo.description,
+                'stars': repo.stargazers_count,
+                'url': repo.html_url,
+            }
+            for repo in repos
+        ]
+        if installable:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                releases = executor.map(
+                    lambda x: self.__get_installable(x, targets), repos
+                )
+                results = [
+                    {**result, **release}
+                    for result, release in zip(results, releases)
+                    if release
+                ]
+        self.__search_cache.set(key, results)
+        return results
 
     def info(self, name: str, output: str) -> Dict[str, Any]:
         """Retrieve package information."""
-        return {}
+        dependency = self._get_dependency(package=name)
+        if not dependency:
+            return {}
+
+        info = {
+            'name': name,
+            'version': dependency.version,
+            'asset': dependency.name,
+            'url': dependency.url,
+        }
+        asset_path = self.__store.get_asset_path(dependency)
+        if self.__store.has_asset(dependency) and (
+            self.__archive.is_tarball(asset_path)
+        ):
+            # list stored tarball contents from its index without unpacking
+            info['contents'] = self.__archive.get_members(asset_path)
+        return info
 
     def __download(
         self, dependency: Dependency, dest: str, **options: Any
@@ -236,7 +804,7 @@ class PackageManager(PackageManagerBase):
             dependency.url,
             headers={'Accept': 'application/octet-stream'},
         )
-        with urlopen(request) as response:
+        with urlopen(request, timeout=config.download_timeout) as response:
             data = response.read()
             with open(dest, 'wb') as f:
                 f.write(data)
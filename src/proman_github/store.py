@@ -0,0 +1,166 @@
+# copyright: (c) 2020 by Jesse Johnson.
+# license: LGPL-3.0, see LICENSE.md for more details.
+"""Provide shared local store for release assets."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+from proman_github.lock import FileLock
+
+if TYPE_CHECKING:
+    from proman_github.dependency import Dependency
+
+
+@dataclass
+class StoredAsset:
+    """Provide release asset metadata recorded in the store."""
+
+    id: int
+    name: str
+    url: str
+    content_type: str
+    tag_name: str
+    exact: bool = False
+
+
+class AssetStore:
+    """Manage downloaded and unpacked release assets.
+
+    Assets are keyed by their GitHub asset id so that every install scope
+    on a host shares a single download and unpacked copy of each asset.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize asset store."""
+        self.path = path
+
+    def get_asset_dir(self, dependency: 'Dependency') -> str:
+        """Get store directory for asset."""
+        return os.path.join(self.path, str(dependency.id))
+
+    def get_asset_path(self, dependency: 'Dependency') -> str:
+        """Get store path for downloaded asset."""
+        return os.path.join(
+            self.get_asset_dir(dependency), os.path.basename(dependency.name)
+        )
+
+    def get_contents_dir(self, dependency: 'Dependency') -> str:
+        """Get store directory for unpacked asset contents."""
+        return os.path.join(self.get_asset_dir(dependency), 'contents')
+
+    def get_lock(self, key: str) -> FileLock:
+        """Get cross-process lock for key within store."""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return FileLock(os.path.join(self.path, '.locks', f"{digest}.lock"))
+
+    def get_release_path(
+        self, package: str, version: str, target: str
+    ) -> str:
+        """Get store path for recorded release asset resolution."""
+        return os.path.join(
+            self.path,
+            '.releases',
+            *package.split('/'),
+            version,
+            f"{target.replace('/', '-')}.json",
+        )
+
+    def get_release_asset(
+        self, package: str, version: str, target: str
+    ) -> Optional[StoredAsset]:
+        """Get recorded release asset for package version and target."""
+        release_path = self.get_release_path(package, version, target)
+        if os.path.isfile(release_path):
+            with open(release_path, 'r') as f:
+                return StoredAsset(**json.load(f))
+        return None
+
+    def add_release_asset(
+        self,
+        package: str,
+        version: str,
+        target: str,
+        asset: Any,
+        exact: bool = False,
+    ) -> None:
+        """Record release asset resolved for package version and target.
+
+        Assets matching only part of the target are recorded as inexact
+        so that lookups requiring both platform and architecture skip them.
+
+        """
+        release_path = self.get_release_path(package, version, target)
+        os.makedirs(os.path.dirname(release_path), exist_ok=True)
+        stored_asset = StoredAsset(
+            id=asset.id,
+            name=asset.name,
+            url=asset.url,
+            content_type=asset.content_type,
+            tag_name=version,
+            exact=exact,
+        )
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(release_path), prefix='.', suffix='.part'
+        )
+        with os.fdopen(fd, 'w') as f:
+            json.dump(asdict(stored_asset), f)
+        os.replace(temp_path, release_path)
+
+    def has_asset(self, dependency: 'Dependency') -> bool:
+        """Check if asset has already been downloaded."""
+        return os.path.isfile(self.get_asset_path(dependency))
+
+    def add_asset(
+        self,
+        dependency: 'Dependency',
+        download: Callable[['Dependency', str], None],
+    ) -> str:
+        """Download asset into store unless already present."""
+        asset_path = self.get_asset_path(dependency)
+        if os.path.isfile(asset_path):
+            return asset_path
+
+        with self.get_lock(f"asset:{dependency.id}"):
+            if not os.path.isfile(asset_path):
+                asset_dir = self.get_asset_dir(dependency)
+                os.makedirs(asset_dir, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(
+                    dir=asset_dir, prefix='.', suffix='.part'
+                )
+                os.close(fd)
+                try:
+                    download(dependency, temp_path)
+                    os.replace(temp_path, asset_path)
+                finally:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+        return asset_path
+
+    def unpack_asset(
+        self,
+        dependency: 'Dependency',
+        unpack: Callable[[str, str], None],
+    ) -> str:
+        """Unpack stored asset unless already unpacked."""
+        contents_dir = self.get_contents_dir(dependency)
+        if os.path.isdir(contents_dir):
+            return contents_dir
+
+        with self.get_lock(f"asset:{dependency.id}"):
+            if not os.path.isdir(contents_dir):
+                temp_dir = tempfile.mkdtemp(
+                    dir=self.get_asset_dir(dependency), prefix='.contents-'
+                )
+                try:
+                    unpack(self.get_asset_path(dependency), temp_dir)
+                    os.rename(temp_dir, contents_dir)
+                finally:
+                    if os.path.isdir(temp_dir):
+                        shutil.rmtree(temp_dir)
+        return contents_dir
@@ -0,0 +1,121 @@
+'''Test archive index.'''
+
+import io
+import os
+import tarfile
+
+from proman_github.archive import Archive
+
+
+def add_member(archive, name, data=b'', mode=0o644, pax_headers=None):
+    '''Add regular file to tarball.'''
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = mode
+    if pax_headers:
+        info.pax_headers = pax_headers
+    archive.addfile(info, io.BytesIO(data))
+
+
+def patch_header(path, name, start, field):
+    '''Replace field in member header and recompute checksum.'''
+    with open(path, 'rb') as f:
+        data = bytearray(f.read())
+    for offset in range(0, len(data), 512):
+        if data[offset:offset + 100].rstrip(b'\0') == name.encode():
+            header = data[offset:offset + 512]
+            header[start:start + len(field)] = field
+            header[148:156] = b' ' * 8
+            header[148:156] = b'%06o\0 ' % sum(header)
+            data[offset:offset + 512] = header
+            break
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def test_gnu_long_name(tmp_path):
+    path = str(tmp_path / 'gnu.tar')
+    name = 'tool/' + 'x' * 150 + '/tool'
+    with tarfile.open(path, 'w', format=tarfile.GNU_FORMAT) as archive:
+        add_member(archive, name, b'#!/bin/sh\n', 0o755)
+    assert Archive().get_members(path) == [name]
+
+
+def test_pax_path(tmp_path):
+    path = str(tmp_path / 'pax.tar')
+    name = 'tool/' + 'y' * 150 + '/ü.txt'
+    with tarfile.open(path, 'w', format=tarfile.PAX_FORMAT) as archive:
+        add_member(archive, name, b'long' * 300)
+    archive = Archive()
+    assert archive.get_members(path) == [name]
+    dest = archive.extract_member(path, name, str(tmp_path / 'out'))
+    with open(dest, 'rb') as f:
+        assert f.read() == b'long' * 300
+
+
+def test_pax_size(tmp_path):
+    path = str(tmp_path / 'pax.tar')
+    with tarfile.open(path, 'w', format=tarfile.PAX_FORMAT) as archive:
+        add_member(archive, 'data', b'z' * 700, pax_headers={'size': '700'})
+        add_member(archive, 'after', b'after')
+    # header size is ignored in favour of the extended header
+    patch_header(path, 'data', 124, b'%011o\0' % 0)
+    archive = Archive()
+    assert archive.index(path)['data'].size == 700
+    dest = archive.extract_member(path, 'after', str(tmp_path / 'out'))
+    with open(dest, 'rb') as f:
+        assert f.read() == b'after'
+
+
+def test_ustar_prefix(tmp_path):
+    path = str(tmp_path / 'ustar.tar')
+    name = 'p' * 120 + '/tool'
+    with tarfile.open(path, 'w', format=tarfile.USTAR_FORMAT) as archive:
+        add_member(archive, name, b'prefix')
+    assert Archive().get_members(path) == [name]
+
+
+def test_base256_size(tmp_path):
+    path = str(tmp_path / 'gnu.tar')
+    with tarfile.open(path, 'w', format=tarfile.GNU_FORMAT) as archive:
+        add_member(archive, 'data', b'b' * 1000)
+        add_member(archive, 'after', b'after')
+    patch_header(path, 'data', 124, b'\x80' + (1000).to_bytes(11, 'big'))
+    archive = Archive()
+    assert archive.index(path)['data'].size == 1000
+    assert archive.get_members(path) == ['data', 'after']
+
+
+def test_zero_size_member(tmp_path):
+    path = str(tmp_path / 'empty.tar')
+    with tarfile.open(path, 'w') as archive:
+        add_member(archive, 'empty')
+        add_member(archive, 'tool', b'#!/bin/sh\n', 0o755)
+    archive = Archive()
+    member = archive.index(path)['empty']
+    assert member.size == 0
+    dest = archive.extract_member(path, 'empty', str(tmp_path / 'out'))
+    assert os.path.getsize(dest) == 0
+    dest = archive.extract_member(path, 'tool', str(tmp_path / 'out'))
+    assert os.stat(dest).st_mode & 0o777 == 0o755
+
+
+def test_compressed_index(tmp_path):
+    path = str(tmp_path / 'tool.tar.gz')
+    with tarfile.open(path, 'w:gz') as archive:
+        add_member(archive, 'tool', b'#!/bin/sh\n', 0o755)
+        add_member(archive, 'README', b'readme')
+    archive = Archive()
+    assert archive.get_members(path) == ['tool', 'README']
+    assert os.path.isfile(str(tmp_path / 'tool.tar.index.json'))
+    archive.unpack_executables(path, str(tmp_path / 'out'))
+    assert os.listdir(str(tmp_path / 'out')) == ['tool']
+
+
+def test_corrupt_index(tmp_path):
+    path = str(tmp_path / 'tool.tar')
+    with tarfile.open(path, 'w') as archive:
+        add_member(archive, 'tool', b'tool')
+    with open(f"{path}.index.json", 'w') as f:
+        f.write('{"key": [')
+    assert Archive().get_members(path) == ['tool']
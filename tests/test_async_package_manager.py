@@ -0,0 +1,72 @@
+'''Test asyncio package manager.'''
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from proman_github.async_package_manager import AsyncPackageManager
+from proman_github.package_manager import PackageManager
+
+
+class BatchPackageManager(PackageManager):
+    '''Record package installs and manifest commits.'''
+
+    def __init__(self):
+        super().__init__(github=object())
+        self.installed = []
+        self.commits = []
+
+    def _install_package(self, package, **options):
+        self.installed.append(package)
+        return [('add', package)]
+
+    def _commit(self, changes):
+        self.commits.append(changes)
+
+    def info(self, name, output):
+        time.sleep(0.3)
+        return {'name': name}
+
+
+def test_install_single_commit():
+    package_manager = BatchPackageManager()
+    packages = ['owner/a', 'owner/b', 'owner/c', 'owner/d']
+
+    async def install():
+        async with AsyncPackageManager(package_manager) as manager:
+            await manager.install(*packages)
+
+    asyncio.run(install())
+    assert sorted(package_manager.installed) == packages
+    assert len(package_manager.commits) == 1
+    assert sorted(x for _, x in package_manager.commits[0]) == packages
+
+
+def test_close_keeps_provided_executor():
+    executor = ThreadPoolExecutor(max_workers=1)
+    AsyncPackageManager(BatchPackageManager(), executor=executor).close()
+    assert executor.submit(lambda: True).result()
+    executor.shutdown()
+
+
+def test_exit_does_not_block_loop():
+    package_manager = BatchPackageManager()
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.01)
+
+    async def run():
+        ticker = asyncio.ensure_future(tick())
+        async with AsyncPackageManager(package_manager) as manager:
+            info = asyncio.ensure_future(manager.info('owner/a', 'json'))
+            await asyncio.sleep(0)
+            count = len(ticks)
+        ticker.cancel()
+        assert await info == {'name': 'owner/a'}
+        return len(ticks) - count
+
+    # the ticker keeps running while worker threads finish
+    assert asyncio.run(run()) > 5
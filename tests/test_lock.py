@@ -0,0 +1,44 @@
+'''Test file lock.'''
+
+import subprocess
+import sys
+
+import pytest
+
+from proman_github.lock import FileLock
+
+
+def test_lock_excludes(tmp_path):
+    path = str(tmp_path / 'locks' / 'test.lock')
+    with FileLock(path) as lock:
+        assert lock.is_locked
+        with pytest.raises(TimeoutError):
+            FileLock(path, timeout=0.1).acquire()
+
+
+def test_lock_release(tmp_path):
+    path = str(tmp_path / 'test.lock')
+    lock = FileLock(path)
+    lock.acquire()
+    lock.release()
+    assert not lock.is_locked
+    with FileLock(path, timeout=0.1) as other:
+        assert other.is_locked
+    assert not other.is_locked
+
+
+def test_lock_excludes_process(tmp_path):
+    path = str(tmp_path / 'test.lock')
+    script = (
+        'import sys\n'
+        'from proman_github.lock import FileLock\n'
+        'try:\n'
+        '    FileLock(sys.argv[1], timeout=0.1).acquire()\n'
+        'except TimeoutError:\n'
+        '    sys.exit(3)\n'
+    )
+    with FileLock(path):
+        result = subprocess.run([sys.executable, '-c', script, path])
+        assert result.returncode == 3
+    result = subprocess.run([sys.executable, '-c', script, path])
+    assert result.returncode == 0
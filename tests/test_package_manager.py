@@ -0,0 +1,494 @@
+'''Test package manager.'''
+
+import io
+import json
+import os
+import tarfile
+
+import pytest
+from github import GithubException
+
+from proman_github import package_manager as package_manager_module
+from proman_github.cache import ResultCache
+from proman_github.config import ProjectPaths
+from proman_github.package_manager import PackageManager
+from proman_github.store import AssetStore
+
+
+class Asset:
+    '''Provide release asset.'''
+
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+        self.url = f"https://api.github.com/assets/{id}"
+        self.content_type = 'application/gzip'
+
+
+class Release:
+    '''Provide release.'''
+
+    id = 1
+    tag_name = 'v1.0.0'
+
+    def __init__(self, assets):
+        self.assets = assets
+
+    def get_assets(self):
+        return self.assets
+
+
+class Repository:
+    '''Provide repository.'''
+
+    full_name = 'owner/tool'
+    description = 'tool'
+    stargazers_count = 1
+    html_url = 'https://github.com/owner/tool'
+
+    def __init__(self, release):
+        self.release = release
+
+    def get_latest_release(self):
+        return self.release
+
+    def get_releases(self):
+        return [self.release]
+
+    def get_release(self, id):
+        return self.release
+
+
+class GitHub:
+    '''Provide GitHub client.'''
+
+    def __init__(self, assets):
+        self.repository = Repository(Release(assets))
+
+    def get_repo(self, name):
+        return self.repository
+
+    def search_repositories(self, query, sort, order, **qualifiers):
+        return iter([self.repository] * 12)
+
+
+def test_partial_match_targets(tmp_path):
+    package_manager = PackageManager(
+        github=GitHub(
+            [
+                Asset(1, 'tool_linux_amd64.tar.gz'),
+                Asset(2, 'tool_linux_arm64.tar.gz'),
+            ]
+        ),
+        store=AssetStore(str(tmp_path)),
+        platform='linux',
+        arch='x86_64',
+    )
+    dependencies = package_manager._get_dependencies(
+        'owner/tool', targets='linux/amd64,darwin/arm64,windows/amd64'
+    )
+    assert {k: v.name for k, v in dependencies.items()} == {
+        'linux/amd64': 'tool_linux_amd64.tar.gz'
+    }
+
+
+def test_single_target_match(tmp_path):
+    package_manager = PackageManager(
+        github=GitHub([Asset(1, 'tool_linux.tar.gz')]),
+        store=AssetStore(str(tmp_path)),
+        platform='linux',
+        arch='x86_64',
+    )
+    dependency = package_manager._get_dependency('owner/tool')
+    assert dependency.name == 'tool_linux.tar.gz'
+
+
+def test_inexact_record_not_reused_strictly(tmp_path):
+    package_manager = PackageManager(
+        github=GitHub([Asset(1, 'tool_linux_amd64.tar.gz')]),
+        store=AssetStore(str(tmp_path)),
+        platform='linux',
+        arch='aarch64',
+    )
+    dependency = package_manager._get_dependency(
+        'owner/tool', version='v1.0.0'
+    )
+    assert dependency.name == 'tool_linux_amd64.tar.gz'
+    dependencies = package_manager._get_dependencies(
+        'owner/tool', version='v1.0.0', targets='linux/arm64,linux/amd64'
+    )
+    assert list(dependencies) == ['linux/amd64']
+
+
+def test_install_host_without_arch(tmp_path, downloads, capsys):
+    package_manager = PackageManager(
+        github=GitHub([Asset(1, 'tool_linux.tar.gz')]),
+        store=AssetStore(str(tmp_path / 'store')),
+        paths=ProjectPaths(working_dir=str(tmp_path / 'project')),
+        platform='linux',
+        arch='x86_64',
+    )
+    package_manager.install(
+        'owner/tool', scope='project', targets='linux/arm64'
+    )
+    assert os.path.isfile(
+        str(tmp_path / 'project' / '__pypackages__' / 'bin' / 'tool')
+    )
+    assert 'no asset found: owner/tool linux/arm64' in capsys.readouterr().out
+
+
+def test_search_installable_targets(tmp_path):
+    package_manager = PackageManager(
+        github=GitHub([Asset(1, 'tool_linux_amd64.tar.gz')]),
+        store=AssetStore(str(tmp_path / 'store')),
+        search_cache=ResultCache(str(tmp_path / 'search')),
+    )
+    assert package_manager.search(
+        'tool', installable=True, targets='darwin/arm64'
+    ) == []
+    results = package_manager.search(
+        'tool', installable=True, targets='linux/amd64'
+    )
+    assert [x['name'] for x in results] == ['owner/tool'] * 10
+    assert len(package_manager.search('tool')) == 12
+
+
+def test_search_installable_asset_error(tmp_path):
+    def get_assets():
+        raise GithubException(404, 'not found', {})
+
+    github = GitHub([])
+    github.repository.release.get_assets = get_assets
+    package_manager = PackageManager(
+        github=github,
+        store=AssetStore(str(tmp_path / 'store')),
+        search_cache=ResultCache(str(tmp_path / 'search')),
+    )
+    assert package_manager.search('tool', installable=True) == []
+
+
+def get_tarball(name, data):
+    '''Get gzipped tarball containing a single executable.'''
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mode = 0o755
+        archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    '''Serve release asset downloads without network access.'''
+    requests = []
+    data = get_tarball('tool', b'#!/bin/sh\n')
+
+    def urlopen(request, **kwargs):
+        requests.append(request.full_url)
+        return io.BytesIO(data)
+
+    def from_file(path, mime=False):
+        if path.endswith('.tar.gz'):
+            return 'application/gzip'
+        return 'application/x-executable'
+
+    monkeypatch.setattr(package_manager_module, 'urlopen', urlopen)
+    monkeypatch.setattr(package_manager_module.magic, 'from_file', from_file)
+    return requests
+
+
+def get_package_manager(tmp_path, **options):
+    '''Get package manager installing into temporary paths.'''
+    return PackageManager(
+        github=GitHub([Asset(1, 'tool_linux_amd64.tar.gz')]),
+        store=AssetStore(str(tmp_path / 'store')),
+        paths=ProjectPaths(
+            working_dir=str(tmp_path / 'project'),
+            virtualenv_dir=str(tmp_path / 'venv'),
+        ),
+        platform='linux',
+        arch='x86_64',
+        **options,
+    )
+
+
+@pytest.mark.parametrize(
+    'scope,executable_dir',
+    [
+        ('project', os.path.join('project', '__pypackages__', 'bin')),
+        ('virtualenv', os.path.join('venv', 'bin')),
+        ('user', os.path.join('user', 'bin')),
+    ],
+)
+def test_install_scope(tmp_path, monkeypatch, downloads, scope, executable_dir):
+    schemes = []
+
+    def get_path(name, scheme):
+        schemes.append((name, scheme))
+        return str(tmp_path / 'user' / 'bin')
+
+    monkeypatch.setattr(package_manager_module.sysconfig, 'get_path', get_path)
+    package_manager = get_package_manager(tmp_path)
+    package_manager.install('owner/tool', scope=scope)
+    assert os.path.isfile(str(tmp_path / executable_dir / 'tool'))
+    if scope == 'user':
+        assert schemes == [('scripts', f"{os.name}_user")]
+
+
+def test_install_unknown_scope(tmp_path, downloads):
+    package_manager = get_package_manager(tmp_path)
+    with pytest.raises(Exception, match='scope must be one of'):
+        package_manager.install('owner/tool', scope='system')
+
+
+def test_scopes_share_store(tmp_path, downloads):
+    package_manager = get_package_manager(tmp_path)
+    package_manager.install('owner/tool', scope='project')
+    package_manager.install('owner/tool', scope='virtualenv')
+    for executable_dir in (
+        tmp_path / 'project' / '__pypackages__' / 'bin',
+        tmp_path / 'venv' / 'bin',
+    ):
+        with open(str(executable_dir / 'tool'), 'rb') as f:
+            assert f.read() == b'#!/bin/sh\n'
+    # both scopes are served from one download and unpacked copy
+    assert downloads == ['https://api.github.com/assets/1']
+    assert os.listdir(str(tmp_path / 'store' / '1' / 'contents')) == ['tool']
+
+
+class SettingsFile:
+    '''Provide manifest file stored as JSON.'''
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {'dependencies': {}, 'dev-dependencies': {}}
+        if os.path.isfile(path):
+            with open(path) as f:
+                self.data = json.load(f)
+
+    @staticmethod
+    def dependency_type(dev=False):
+        return 'dev-dependencies' if dev else 'dependencies'
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            json.dump(self.data, f)
+
+
+class SpecFile(SettingsFile):
+    '''Provide source tree file.'''
+
+    def is_dependency(self, dependency):
+        return dependency.name in self.data[
+            self.dependency_type(dependency.is_dev)
+        ]
+
+    def add_dependency(self, dependency):
+        self.data[self.dependency_type(dependency.is_dev)][
+            dependency.name
+        ] = dependency.version
+
+    def remove_dependency(self, dependency):
+        self.data[self.dependency_type(dependency.is_dev)].pop(
+            dependency.name, None
+        )
+
+    def get_dependency(self, name, dev=False):
+        return {
+            k: v
+            for k, v in self.data[self.dependency_type(dev)].items()
+            if k == name
+        }
+
+    def get_dependencies(self, dev=False):
+        return self.data[self.dependency_type(dev)]
+
+
+class LockFile(SettingsFile):
+    '''Provide lockfile.'''
+
+    def __init__(self, path):
+        super().__init__(path)
+        for key, value in self.data.items():
+            self.data[key] = list(value)
+
+    def is_locked(self, dependency):
+        return any(
+            x['name'] == dependency.name
+            for x in self.data[self.dependency_type(dependency.is_dev)]
+        )
+
+    def add_lock(self, dependency, **kwargs):
+        self.data[self.dependency_type(dependency.is_dev)].append(
+            {'name': dependency.name, 'version': dependency.version, **kwargs}
+        )
+
+    def remove_lock(self, dependency):
+        key = self.dependency_type(dependency.is_dev)
+        self.data[key] = [
+            x for x in self.data[key] if x['name'] != dependency.name
+        ]
+
+    def get_lock(self, name, dev=False):
+        locks = [
+            x for x in self.data[self.dependency_type(dev)]
+            if x['name'] == name
+        ]
+        return locks[0] if locks else {}
+
+    def get_locks(self, dev=False):
+        return self.data[self.dependency_type(dev)]
+
+
+class Manifest:
+    '''Provide project manifest.'''
+
+    def __init__(self, paths):
+        self.specfile = SpecFile(paths.pyproject_path)
+        self.lockfile = LockFile(paths.lock_path)
+
+    def save(self):
+        self.specfile.save()
+        self.lockfile.save()
+
+
+class BrokenManifest(Manifest):
+    '''Provide manifest failing after a partial write.'''
+
+    def save(self):
+        with open(self.specfile.path, 'w') as f:
+            f.write('{"dependencies": {')
+        raise OSError('disk full')
+
+
+class CommitPackageManager(PackageManager):
+    '''Record manifest commits.'''
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.commits = []
+
+    def _commit(self, changes):
+        self.commits.append(list(changes))
+        super()._commit(changes)
+
+
+def get_manifest_package_manager(
+    tmp_path, manifest_class=Manifest, manifest_loader=True
+):
+    '''Get package manager with a project manifest on disk.'''
+    paths = ProjectPaths(working_dir=str(tmp_path / 'project'))
+    os.makedirs(paths.working_dir)
+    Manifest(paths).save()
+    return CommitPackageManager(
+        github=GitHub([Asset(1, 'tool_linux_amd64.tar.gz')]),
+        store=AssetStore(str(tmp_path / 'store')),
+        paths=paths,
+        manifest=manifest_class(paths),
+        manifest_loader=manifest_class if manifest_loader else None,
+        platform='linux',
+        arch='x86_64',
+    )
+
+
+def read_manifest(tmp_path):
+    '''Get manifest files of project.'''
+    paths = ProjectPaths(working_dir=str(tmp_path / 'project'))
+    result = []
+    for path in (paths.pyproject_path, paths.lock_path):
+        with open(path, 'rb') as f:
+            result.append(f.read())
+    return result
+
+
+def test_transaction_nesting(tmp_path):
+    package_manager = get_manifest_package_manager(tmp_path)
+    original = read_manifest(tmp_path)
+    with package_manager.transaction():
+        with package_manager.transaction():
+            package_manager.lock('owner/tool', targets='linux/amd64')
+        # nested transactions are written by the outermost one
+        assert read_manifest(tmp_path) == original
+        package_manager.lock('owner/other', targets='linux/amd64')
+    assert len(package_manager.commits) == 1
+    assert len(package_manager.commits[0]) == 2
+    assert read_manifest(tmp_path) != original
+
+
+def test_transaction_discards_changes(tmp_path):
+    package_manager = get_manifest_package_manager(tmp_path)
+    original = read_manifest(tmp_path)
+    with pytest.raises(RuntimeError):
+        with package_manager.transaction():
+            package_manager.lock('owner/tool', targets='linux/amd64')
+            raise RuntimeError('failed')
+    assert package_manager.commits == []
+    with package_manager.transaction():
+        pass
+    assert package_manager.commits == []
+    assert read_manifest(tmp_path) == original
+
+
+@pytest.mark.parametrize('manifest_loader', [True, False])
+def test_commit_restores_snapshot(tmp_path, manifest_loader):
+    package_manager = get_manifest_package_manager(
+        tmp_path, BrokenManifest, manifest_loader
+    )
+    original = read_manifest(tmp_path)
+    with pytest.raises(OSError):
+        package_manager.lock('owner/tool', targets='linux/amd64')
+    assert read_manifest(tmp_path) == original
+    assert [
+        x for x in os.listdir(str(tmp_path / 'project'))
+        if x.startswith('.proman-')
+    ] == []
+
+
+def test_manifest_keyed_by_package(tmp_path, downloads):
+    package_manager = get_manifest_package_manager(tmp_path)
+    package_manager.install(
+        'owner/tool', scope='project', targets='linux/amd64,linux/arm64'
+    )
+    manifest = Manifest(ProjectPaths(working_dir=str(tmp_path / 'project')))
+    assert manifest.specfile.get_dependencies() == {'owner/tool': 'v1.0.0'}
+    lock = manifest.lockfile.get_lock('owner/tool')
+    assert lock['version'] == 'v1.0.0'
+    assert lock['assets'] == {
+        'linux/amd64': {
+            'name': 'tool_linux_amd64.tar.gz',
+            'id': 1,
+            'url': 'https://api.github.com/assets/1',
+        }
+    }
+
+    package_manager.uninstall('owner/tool', scope='project')
+    manifest = Manifest(ProjectPaths(working_dir=str(tmp_path / 'project')))
+    assert manifest.specfile.get_dependencies() == {}
+    assert manifest.lockfile.get_locks() == []
+
+
+def test_prefetch_reports_failures(tmp_path, monkeypatch, downloads, capsys):
+    paths = ProjectPaths(working_dir=str(tmp_path / 'project'))
+    os.makedirs(paths.working_dir)
+    manifest = Manifest(paths)
+    manifest.specfile.data['dependencies']['owner/tool'] = 'v1.0.0'
+    manifest.save()
+
+    def urlopen(request, **kwargs):
+        raise ValueError('unknown url type')
+
+    monkeypatch.setattr(package_manager_module, 'urlopen', urlopen)
+    package_manager = PackageManager(
+        github=GitHub([Asset(1, 'tool_linux_amd64.tar.gz')]),
+        store=AssetStore(str(tmp_path / 'store')),
+        paths=paths,
+        manifest=Manifest(paths),
+        manifest_loader=Manifest,
+        platform='linux',
+        arch='x86_64',
+    )
+    package_manager.prefetch('linux/amd64', 'darwin/arm64')
+    output = capsys.readouterr().out
+    assert 'unable to download: owner/tool linux/amd64' in output
+    assert 'no asset found: owner/tool darwin/arm64' in output